@@ -1,4 +1,5 @@
-from math import atan2
+from functools import lru_cache
+from math import hypot
 from ..Qt import QtGui, QtCore
 from ..Point import Point
 from .. import functions as fn
@@ -12,6 +13,23 @@ import warnings
 
 __all__ = ['TargetItem', 'TargetLabel']
 
+# exact-type dispatch for TargetItem.setPos, which runs on every drag event
+_POS_EXTRACTORS = {
+    Point: lambda pos: pos,
+    tuple: Point,
+    list: Point,
+    QtCore.QPointF: lambda pos: Point(pos.x(), pos.y()),
+    QtCore.QPoint: lambda pos: Point(pos.x(), pos.y()),
+}
+
+
+@lru_cache(maxsize=16)
+def _invertLinearTransform(key):
+    # inverse of the translation-free device transform given by
+    # TargetItem._transformKey; cached so all TargetItems in a view share it
+    return fn.invertQTransform(QtGui.QTransform(*key, 0, 0))
+
+
 class TargetItem(UIGraphicsItem):
     """Draws a draggable target symbol (circle plus crosshair).
 
@@ -113,6 +131,7 @@ class TargetItem(UIGraphicsItem):
         self.currentBrush = self.brush
 
         self._shape = None
+        self._shapeKey = None
 
         self._pos = Point(0, 0)
         if pos is None:
@@ -158,18 +177,23 @@ class TargetItem(UIGraphicsItem):
             If the type of ``pos`` does not match the known types to extract
             coordinate info from, a TypeError is raised
         """
-        if isinstance(pos, Point):
-            newPos = pos
-        elif isinstance(pos, (tuple, list)):
-            newPos = Point(pos)
-        elif isinstance(pos, (QtCore.QPointF, QtCore.QPoint)):
-            newPos = Point(pos.x(), pos.y())
-        else:
-            raise TypeError
-        if self._pos != newPos:
-            self._pos = newPos
-            super().setPos(self._pos)
-            self.sigPositionChanged.emit(self)
+        try:
+            newPos = _POS_EXTRACTORS[type(pos)](pos)
+        except KeyError:
+            # fall back to isinstance checks for subclasses
+            if isinstance(pos, Point):
+                newPos = pos
+            elif isinstance(pos, (tuple, list)):
+                newPos = Point(pos)
+            elif isinstance(pos, (QtCore.QPointF, QtCore.QPoint)):
+                newPos = Point(pos.x(), pos.y())
+            else:
+                raise TypeError
+        if self._pos == newPos:
+            return
+        self._pos = newPos
+        super().setPos(self._pos)
+        self.sigPositionChanged.emit(self)
 
     def setBrush(self, *args, **kwargs):
         """Set the brush that fills the symbol. Allowable arguments are any that
@@ -215,37 +239,56 @@ class TargetItem(UIGraphicsItem):
         p.drawPath(self.shape())
 
     def setPath(self, path):
-        if path != self._path:
-            self._path = path
-            self._shape = None
+        # identity check first; QPainterPath equality compares every element
+        if path is self._path or path == self._path:
+            return None
+        self._path = path
+        self._shape = None
         return None
 
+    @staticmethod
+    def _transformKey(dt):
+        # The generated shape depends only on the linear part of the device
+        # transform; the translation cancels out between devPos and dti, so
+        # panning the view can reuse the previously mapped path.
+        return (dt.m11(), dt.m12(), dt.m21(), dt.m22())
+
     def shape(self):
+        # viewTransformChanged drops the shape when the transform key changes,
+        # so a cached shape is valid as is; dragging never has to look up
+        # the device transform here.
         if self._shape is None:
-            s = self.generateShape()
-            if s is None:
+            dt = self.deviceTransform()
+            if dt is None:
                 return self._path
-            self._shape = s
+            self._shape = self.generateShape(dt)
+            self._shapeKey = self._transformKey(dt)
 
             # beware--this can cause the view to adjust
             # which would immediately invalidate the shape.
             self.prepareGeometryChange()
         return self._shape
 
-    def generateShape(self):
-        dt = self.deviceTransform()
+    def generateShape(self, dt=None):
         if dt is None:
-            self._shape = self._path
-            return None
-        v = dt.map(QtCore.QPointF(1, 0)) - dt.map(QtCore.QPointF(0, 0))
-        dti = fn.invertQTransform(dt)
-        devPos = dt.map(QtCore.QPointF(0, 0))
-        tr = QtGui.QTransform()
-        tr.translate(devPos.x(), devPos.y())
-        va = atan2(v.y(), v.x())
-        tr.rotateRadians(va)
-        tr.scale(self.scale, self.scale)
-        return dti.map(tr.map(self._path))
+            dt = self.deviceTransform()
+            if dt is None:
+                return None
+        key = self._transformKey(dt)
+        # direction of the view's x axis in device coordinates
+        vx, vy = key[0], key[1]
+        # rotate(angle of v) * scale(self.scale), built directly from the
+        # direction of v instead of going through atan2
+        norm = hypot(vx, vy)
+        if norm == 0:
+            c, s = self.scale, 0.0
+        else:
+            c = self.scale * vx / norm
+            s = self.scale * vy / norm
+        tr = QtGui.QTransform(c, s, -s, c, 0, 0)
+        # the device offset cancels between tr and the inverse, so only the
+        # linear part needs inverting; this is shared by items in one view
+        return _invertLinearTransform(key).map(tr.map(self._path))
 
     def mouseDragEvent(self, ev):
         if not self.movable or ev.button() != QtCore.Qt.MouseButton.LeftButton:
@@ -291,8 +334,10 @@ class TargetItem(UIGraphicsItem):
 
     def viewTransformChanged(self):
         GraphicsObject.viewTransformChanged(self)
-        self._shape = None  # invalidate shape, recompute later if requested.
-        self.update()
+        dt = self.deviceTransform()
+        if dt is None or self._transformKey(dt) != self._shapeKey:
+            self._shape = None  # invalidate shape, recompute later if requested.
+            self.update()
 
     def pos(self):
         """Provides the current position of the TargetItem
@@ -325,7 +370,7 @@ class TargetItem(UIGraphicsItem):
             If None, do not show any text next to the TargetItem
             If Callable, then the label will display the result of ``text(x, y)``
             If a fromatted string, then the output of ``text.format(x, y)`` will be
-            displayed
+            displayed; named fields ``{x}`` and ``{y}`` may be used as well
             If a non-formatted string, then the text label will display ``text``, by
             default None
         labelOpts : dictionary, optional
@@ -405,6 +450,9 @@ class TargetLabel(TextItem):
         super().__init__(anchor=anchor, **kwargs)
         self.setParentItem(target)
         self.target = target
+        self._lastText = None
+        self._formatter = None
+        self._formatValues = {}
         self.setFormat(text)
 
         self.target.sigPositionChanged.connect(self.valueChanged)
@@ -423,27 +471,75 @@ class TargetLabel(TextItem):
             Details how to format the text.
             If Callable, then the label will display the result of ``text(x, y)``
             If a fromatted string, then the output of ``text.format(x, y)`` will be
-            displayed
+            displayed; named fields ``{x}`` and ``{y}`` may be used as well
             If a non-formatted string, then the text label will display ``text``
         """
         if not callable(text):
             parsed = list(string.Formatter().parse(text))
             if parsed and parsed[0][1] is not None:
                 self.setProperty("formattableText", True)
+                self._formatter = self._makeFormatter(text, parsed)
             else:
                 self.setText(text)
                 self.setProperty("formattableText", False)
+                self._formatter = None
         else:
             self.setProperty("formattableText", False)
+            self._formatter = text
         self._format = text
+        self._lastText = None
         self.valueChanged()
 
+    def _makeFormatter(self, text, parsed):
+        # classify on the argument name only, so "{0.real}" or "{[1]}" count
+        # as positional
+        args = [
+            field.split(".", 1)[0].split("[", 1)[0]
+            for _, field, _, _ in parsed if field is not None
+        ]
+        positional = [arg == "" or arg.isdigit() for arg in args]
+        fmt = text.format
+        if all(positional):
+            return lambda x, y: fmt(float(x), float(y))
+        values = self._formatValues
+        if not any(positional):
+            # named fields only; reuse one mapping rather than building
+            # argument containers on every move
+            fmap = text.format_map
+
+            def formatter(x, y):
+                values["x"] = float(x)
+                values["y"] = float(y)
+                return fmap(values)
+        else:
+            def formatter(x, y):
+                values["x"] = float(x)
+                values["y"] = float(y)
+                return fmt(values["x"], values["y"], **values)
+        return formatter
+
     def valueChanged(self):
+        # _formatter is resolved once in setFormat so that the per-move path
+        # does not query the Qt "formattableText" property
+        if self._formatter is None:
+            return
         x, y = self.target.pos()
-        if self.property("formattableText"):
-            self.setText(self._format.format(float(x), float(y)))
-        elif callable(self._format):
-            self.setText(self._format(x, y))
+        text = self._formatter(x, y)
+        # moves below the displayed precision render the same string; skip
+        # setText so the text layout is not touched
+        if text != self._lastText:
+            self.setText(text)
+            self._lastText = text
+
+    def setPlainText(self, text):
+        # the text was set from outside valueChanged, so the last rendered
+        # string no longer describes what is displayed
+        self._lastText = None
+        super().setPlainText(text)
+
+    def setHtml(self, html):
+        self._lastText = None
+        super().setHtml(html)
 
     def viewTransformChanged(self):
         viewbox = self.getViewBox()
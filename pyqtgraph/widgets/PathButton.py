@@ -1,16 +1,37 @@
-from ..Qt import QtGui, QtCore
+from functools import lru_cache
+from ..Qt import QtGui, QtCore, QtWidgets
 from .. import functions as fn
 
 __all__ = ['PathButton']
 
 
-class PathButton(QtGui.QPushButton):
+def _isCacheable(arg):
+    # only plain immutable specs; mkColor treats int and float differently,
+    # so the caches below are typed. Tuple entries are all passed through
+    # int() by mkColor, so their types don't matter.
+    if type(arg) in (str, int, float):
+        return True
+    return type(arg) is tuple and all(type(v) in (int, float) for v in arg)
+
+
+@lru_cache(maxsize=128, typed=True)
+def _cachedPen(*args):
+    return fn.mkPen(*args)
+
+
+@lru_cache(maxsize=128, typed=True)
+def _cachedBrush(brush):
+    return fn.mkBrush(brush)
+
+
+class PathButton(QtWidgets.QPushButton):
     """Simple PushButton extension that paints a QPainterPath centered on its face.
     """
     def __init__(self, parent=None, path=None, pen='default', brush=None, size=(30,30), margin=7):
-        QtGui.QPushButton.__init__(self, parent)
+        super().__init__(parent)
         self.margin = margin
         self.path = None
+        self._paintTransform = None
         if pen == 'default':
             pen = 'k'
         self.setPen(pen)
@@ -22,27 +43,50 @@ class PathButton(QtGui.QPushButton):
             self.setFixedHeight(size[1])
             
     def setBrush(self, brush):
-        self.brush = fn.mkBrush(brush)
+        if _isCacheable(brush):
+            # copy so that buttons sharing a cached brush stay independent
+            self.brush = QtGui.QBrush(_cachedBrush(brush))
+        else:
+            self.brush = fn.mkBrush(brush)
         
     def setPen(self, *args, **kwargs):
-        self.pen = fn.mkPen(*args, **kwargs)
+        if not kwargs and all(_isCacheable(arg) for arg in args):
+            self.pen = QtGui.QPen(_cachedPen(*args))
+        else:
+            self.pen = fn.mkPen(*args, **kwargs)
         
     def setPath(self, path):
         self.path = path
+        self._rebuildPaintTransform()
         self.update()
-        
-    def paintEvent(self, ev):
-        super().paintEvent(ev)
+
+    def _rebuildPaintTransform(self):
+        # map the path's bounding rect onto the button face, minus margin
+        if self.path is None:
+            self._paintTransform = None
+            return
         margin = self.margin
         geom = QtCore.QRectF(0, 0, self.width(), self.height()).adjusted(margin, margin, -margin, -margin)
         rect = self.path.boundingRect()
         scale = min(geom.width() / float(rect.width()), geom.height() / float(rect.height()))
+        tr = QtGui.QTransform()
+        tr.translate(geom.center().x(), geom.center().y())
+        tr.scale(scale, scale)
+        tr.translate(-rect.center().x(), -rect.center().y())
+        self._paintTransform = tr
+
+    def resizeEvent(self, ev):
+        super().resizeEvent(ev)
+        self._rebuildPaintTransform()
+        
+    def paintEvent(self, ev):
+        super().paintEvent(ev)
+        if self._paintTransform is None:
+            return
         
         p = QtGui.QPainter(self)
         p.setRenderHint(p.RenderHint.Antialiasing)
-        p.translate(geom.center())
-        p.scale(scale, scale)
-        p.translate(-rect.center())
+        p.setTransform(self._paintTransform, True)
         p.setPen(self.pen)
         p.setBrush(self.brush)
         p.drawPath(self.path)
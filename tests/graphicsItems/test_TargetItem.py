@@ -0,0 +1,191 @@
+from math import atan2
+
+import numpy as np
+import pytest
+
+import pyqtgraph as pg
+from pyqtgraph.Qt import QtCore, QtGui, QtWidgets
+
+app = pg.mkQApp()
+
+
+def test_TargetItem_small_scale_setPos():
+    plt = pg.plot()
+    plt.setXRange(0, 1e-8, padding=0)
+    plt.setYRange(0, 1e-8, padding=0)
+    target = pg.TargetItem(pos=(0, 0))
+    plt.addItem(target)
+    app.processEvents()
+
+    moved = []
+    target.sigPositionChanged.connect(moved.append)
+
+    target.setPos((5e-10, 0))
+    assert target.pos() == pg.Point(5e-10, 0)
+    assert len(moved) == 1
+
+    # repeated small steps accumulate
+    for _ in range(4):
+        target.setPos(target.pos() + pg.Point(5e-10, 0))
+    assert abs(target.pos().x() - 2.5e-9) < 1e-15
+    assert len(moved) == 5
+
+    # an unchanged position does not emit
+    target.setPos(target.pos())
+    assert len(moved) == 5
+
+
+def test_TargetLabel_formats():
+    plt = pg.plot()
+    target = pg.TargetItem(pos=(1.5, -2.25))
+    plt.addItem(target)
+
+    target.setLabel("{:.2f}, {:.2f}")
+    assert target.label().toPlainText() == "1.50, -2.25"
+
+    target.setLabel("{1:.1f} {0:.1f}")
+    assert target.label().toPlainText() == "-2.2 1.5"
+
+    target.setLabel("{0.real:.3f}, {1.real:.3f}")
+    assert target.label().toPlainText() == "1.500, -2.250"
+
+    target.setLabel("x={x:.1f} y={y:.1f}")
+    assert target.label().toPlainText() == "x=1.5 y=-2.2"
+
+    target.setLabel("{:.1f} y={y:.2f}")
+    assert target.label().toPlainText() == "1.5 y=-2.25"
+
+    target.setLabel(lambda x, y: "(%g, %g)" % (x, y))
+    assert target.label().toPlainText() == "(1.5, -2.25)"
+
+    target.setLabel("fixed text")
+    assert target.label().toPlainText() == "fixed text"
+
+    target.setLabel("x={x:.1f}")
+    target.setPos((3, 4))
+    assert target.label().toPlainText() == "x=3.0"
+
+
+def _legacyShape(target, dt):
+    # construction used before the shape was built from the linear part of
+    # the device transform only
+    v = dt.map(QtCore.QPointF(1, 0)) - dt.map(QtCore.QPointF(0, 0))
+    dti = pg.functions.invertQTransform(dt)
+    devPos = dt.map(QtCore.QPointF(0, 0))
+    tr = QtGui.QTransform()
+    tr.translate(devPos.x(), devPos.y())
+    tr.rotateRadians(atan2(v.y(), v.x()))
+    tr.scale(target.scale, target.scale)
+    return dti.map(tr.map(target._path))
+
+
+def _assertPathsClose(p1, p2):
+    assert p1.elementCount() == p2.elementCount()
+    for i in range(p1.elementCount()):
+        e1, e2 = p1.elementAt(i), p2.elementAt(i)
+        assert e1.type == e2.type
+        assert abs(e1.x - e2.x) < 1e-9 * max(1.0, abs(e2.x))
+        assert abs(e1.y - e2.y) < 1e-9 * max(1.0, abs(e2.y))
+
+
+@pytest.mark.parametrize("m11,m12,m21,m22,dx,dy", [
+    (1, 0, 0, 1, 0, 0),
+    (50, 0, 0, -20, 300, 200),
+    (0.01, 0, 0, -3e4, -15, 7.5),
+    (12, 5, -5, 12, 40, -80),
+    (0, -2, 3, 0, 1e3, 1e-3),
+])
+def test_TargetItem_generateShape_matches_legacy(m11, m12, m21, m22, dx, dy):
+    target = pg.TargetItem(size=12)
+    dt = QtGui.QTransform(m11, m12, m21, m22, dx, dy)
+    _assertPathsClose(target.generateShape(dt), _legacyShape(target, dt))
+
+    # the generated shape does not depend on the device offset
+    moved = QtGui.QTransform(m11, m12, m21, m22, dx + 123.5, dy - 42)
+    _assertPathsClose(target.generateShape(moved), target.generateShape(dt))
+
+
+def test_TargetItem_shape_invalidation():
+    plt = pg.plot()
+    plt.resize(400, 400)
+    plt.setXRange(0, 10, padding=0)
+    plt.setYRange(0, 10, padding=0)
+    target = pg.TargetItem(pos=(5, 5))
+    plt.addItem(target)
+    plt.show()
+    app.processEvents()
+
+    shape = target.shape()
+    assert target._shape is shape
+    transformChanges = []
+    plt.getViewBox().sigTransformChanged.connect(transformChanges.append)
+
+    # panning only translates the device transform; the shape is kept
+    plt.setXRange(5, 15, padding=0)
+    plt.setYRange(5, 15, padding=0)
+    app.processEvents()
+    assert transformChanges
+    assert target._shape is shape
+
+    # zooming changes the linear part; the shape is regenerated
+    plt.setXRange(0, 40, padding=0)
+    app.processEvents()
+    assert target.shape() is not shape
+    plt.close()
+
+
+def test_TargetLabel_skips_unchanged_text():
+    plt = pg.plot()
+    target = pg.TargetItem(pos=(1, 0), label="{:.0f}")
+    plt.addItem(target)
+    label = target.label()
+    assert label.toPlainText() == "1"
+
+    rendered = []
+    setText = label.setText
+    def countingSetText(*args, **kwargs):
+        rendered.append(args[0])
+        setText(*args, **kwargs)
+    label.setText = countingSetText
+
+    # same formatted string; setText is skipped
+    target.setPos((1.2, 0))
+    assert rendered == []
+    target.setPos((2.2, 0))
+    assert rendered == ["2"]
+
+    # text set from outside is replaced on the next move, even when the
+    # formatted string matches the last one rendered
+    setText("external")
+    target.setPos((2.3, 0))
+    assert label.toPlainText() == "2"
+    label.setHtml("<b>external</b>")
+    target.setPos((2.4, 0))
+    assert label.toPlainText() == "2"
+
+
+def _renderTarget(cacheMode=None):
+    plt = pg.plot()
+    plt.resize(300, 300)
+    plt.setXRange(0, 10, padding=0)
+    plt.setYRange(0, 10, padding=0)
+    plt.hideAxis("left")
+    plt.hideAxis("bottom")
+    target = pg.TargetItem(pos=(5, 5), size=30, pen=pg.mkPen("r", width=8))
+    if cacheMode is not None:
+        target.setCacheMode(cacheMode)
+    plt.addItem(target)
+    plt.show()
+    app.processEvents()
+    image = plt.grab().toImage()
+    plt.close()
+    return pg.functions.imageToArray(image, copy=True)
+
+
+def test_TargetItem_wide_pen_render_matches_uncached():
+    # the full stroke of a wide pen must be drawn, exactly as without any
+    # item caching
+    rendered = _renderTarget()
+    uncached = _renderTarget(QtWidgets.QGraphicsItem.CacheMode.NoCache)
+    assert rendered.shape == uncached.shape
+    assert np.array_equal(rendered, uncached)
@@ -0,0 +1,26 @@
+import pyqtgraph as pg
+
+pg.mkQApp()
+
+
+def test_PathButton_cached_pen_is_typed():
+    # int and float pen specs map to different colors in mkColor; the
+    # shared pen cache must not conflate them
+    intButton = pg.PathButton(pen=1)
+    floatButton = pg.PathButton(pen=1.0)
+    assert intButton.pen.color() == pg.mkPen(1).color()
+    assert floatButton.pen.color() == pg.mkPen(1.0).color()
+    assert intButton.pen.color() != floatButton.pen.color()
+
+
+def test_PathButton_cached_brush_is_typed():
+    intButton = pg.PathButton(brush=1)
+    floatButton = pg.PathButton(brush=1.0)
+    assert intButton.brush.color() != floatButton.brush.color()
+
+
+def test_PathButton_pens_are_independent():
+    b1 = pg.PathButton(pen='r')
+    b2 = pg.PathButton(pen='r')
+    b1.pen.setWidth(5)
+    assert b2.pen.width() != 5